@@ -6,18 +6,89 @@ import platform
 import subprocess
 import os
 import sys
+import time
+import queue
+import threading
+from collections import deque
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the kernels below run as plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+@njit(cache=True, fastmath=True)
+def _gesture_kernel(tx, ty, ix, iy, min_d, max_d):
+    """Return the clamped thumb-index distance and its 0-1 position in the gesture range"""
+    dx = tx - ix
+    dy = ty - iy
+    d = math.sqrt(dx * dx + dy * dy)
+    if d < min_d:
+        d = min_d
+    elif d > max_d:
+        d = max_d
+    return d, (d - min_d) / (max_d - min_d)
+
+def _put_latest(q, item):
+    """Put an item on a bounded queue, dropping the oldest entry if it is full"""
+    while True:
+        try:
+            q.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+
+def _draw_solid(overlay, mask, draw, color):
+    """Draw an element into an overlay/mask pair with hard edges"""
+    # Drawing coverage on its own and thresholding it keeps anti-aliased
+    # edges (OpenCV 5 always anti-aliases text) from blitting as dark fringes
+    coverage = np.zeros(mask.shape, dtype=np.uint8)
+    draw(coverage, 255)
+    solid = coverage >= 128
+    overlay[solid] = color
+    mask[solid] = 255
+
+class RunningMean:
+    """Mean of the last maxlen values"""
+    def __init__(self, maxlen):
+        self.values = deque(maxlen=maxlen)
+    
+    def __len__(self):
+        return len(self.values)
+    
+    def update(self, value):
+        """Add a value and return the mean of the window"""
+        self.values.append(value)
+        # Re-summing the small window avoids the drift of a running total,
+        # which could leave the truncated mean stuck one unit low
+        return sum(self.values) / len(self.values)
+    
+    def clear(self):
+        """Drop all values"""
+        self.values.clear()
 
 class GestureVolumeController:
-    def __init__(self):
-        # Initialize MediaPipe hands
+    def __init__(self, use_opencl=False):
+        # Initialize MediaPipe hands. The lite model is plenty for a two-fingertip
+        # pinch, and a lower tracking threshold keeps MediaPipe on its cheap
+        # tracking path instead of re-running the palm detector
         self.mp_hands = mp.solutions.hands
         self.hands = self.mp_hands.Hands(
             static_image_mode=False,
             max_num_hands=1,
+            model_complexity=0,
             min_detection_confidence=0.7,
-            min_tracking_confidence=0.5
+            min_tracking_confidence=0.4
         )
-        self.mp_drawing = mp.solutions.drawing_utils
+        
+        # Landmark index pairs of the hand skeleton, for drawing it in one call
+        self._hand_connections = np.array(sorted(self.mp_hands.HAND_CONNECTIONS), dtype=np.int32)
         
         # Volume control parameters
         self.min_vol = 0
@@ -30,13 +101,72 @@ class GestureVolumeController:
         self.max_hand_distance = 200
         
         # Smoothing parameters
-        self.volume_history = []
-        self.vol_per_history = []
         self.history_size = 5
+        self.volume_history = RunningMean(self.history_size)
+        self.vol_per_history = RunningMean(self.history_size)
+        
+        # Volume update throttling (system volume calls are expensive)
+        self.volume_update_interval = 0.05
+        self._pending_vol = None
+        self._last_vol_sent = -1
+        self._last_vol_ts = 0.0
         
         # OS detection for volume control
         self.os_type = platform.system()
         
+        # Persistent `osascript -i` session on macOS, started on first use
+        self._osa_proc = None
+        
+        # Last amixer call on Linux; only one is kept in flight at a time
+        self._amixer_proc = None
+        
+        # Resolve the Windows endpoint volume interface once instead of per call
+        self._vol_iface = None
+        if self.os_type == "Windows":
+            try:
+                from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+                from comtypes import CLSCTX_ALL
+                from ctypes import cast, POINTER
+                
+                devices = AudioUtilities.GetSpeakers()
+                interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+                self._vol_iface = cast(interface, POINTER(IAudioEndpointVolume))
+            except ImportError:
+                pass
+            except Exception as e:
+                # e.g. no playback device; fall back to nircmd instead of failing
+                print(f"Could not access audio endpoint, falling back to nircmd: {e}")
+        
+        # Hand detection runs on a downscaled copy (landmarks are normalized,
+        # so drawing on the full-size frame needs no rescaling)
+        self.inference_scale = 0.5
+        self._small_buf = None
+        
+        # Optionally run that resize and colour conversion through OpenCL (T-API).
+        # Off by default: the upload/download usually costs more than the CPU
+        # resize, and haveOpenCL() is also true for CPU-only OpenCL runtimes
+        self.use_opencl = use_opencl and cv2.ocl.haveOpenCL()
+        if self.use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+        
+        # Double-buffered hand-off to the inference thread: the main thread
+        # stages frames into _buf[_write_idx] while MediaPipe reads _buf[_read_idx]
+        self._buf = [None, None]
+        self._write_idx = 0
+        self._read_idx = 1
+        self._buf_lock = threading.Lock()
+        self._frame_ready = threading.Event()
+        self._last_result = (0, None)
+        self._consumed_seq = 0
+        self._last_landmarks = None
+        
+        # Pre-rendered static overlay and its mask, rebuilt only when the frame size changes
+        self._overlay = None
+        self._overlay_mask = None
+        
+        # Rendered volume labels keyed by integer volume, for the same frame size
+        self._vol_labels = {}
+        
         # Initialize volume tracking
         self.current_vol_smooth = 0
         self.current_vol_per_smooth = 0
@@ -45,57 +175,275 @@ class GestureVolumeController:
         """Set system volume based on OS"""
         try:
             if self.os_type == "Windows":
-                # Try pycaw first (more reliable)
-                try:
-                    from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
-                    from comtypes import CLSCTX_ALL
-                    from ctypes import cast, POINTER
-                    
-                    devices = AudioUtilities.GetSpeakers()
-                    interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-                    volume_interface = cast(interface, POINTER(IAudioEndpointVolume))
-                    volume_interface.SetMasterScalarVolume(volume / 100.0, None)
-                except ImportError:
+                # Use pycaw when available (more reliable)
+                if self._vol_iface is not None:
+                    self._vol_iface.SetMasterScalarVolume(volume / 100.0, None)
+                else:
                     # Fallback to nircmd
                     os.system(f"nircmd setsysvolume {int(volume * 655.35)}")
             elif self.os_type == "Darwin":  # macOS
-                os.system(f"osascript -e 'set volume output volume {volume}'")
+                self._run_osascript(f"set volume output volume {int(volume)}")
             elif self.os_type == "Linux":
-                # Linux using amixer
-                os.system(f"amixer -D pulse sset Master {volume}%")
+                # Linux using amixer, started directly without a shell. Waiting for
+                # the previous call keeps updates in order and reaps the child.
+                if self._amixer_proc is not None:
+                    self._amixer_proc.wait()
+                self._amixer_proc = subprocess.Popen(
+                    ["amixer", "-D", "pulse", "sset", "Master", f"{int(volume)}%"],
+                    stdout=subprocess.DEVNULL,
+                )
         except Exception as e:
             print(f"Error setting volume: {e}")
     
+    def _run_osascript(self, script):
+        """Run one line of AppleScript through a persistent osascript process"""
+        if self._osa_proc is None or self._osa_proc.poll() is not None:
+            self._osa_proc = subprocess.Popen(
+                ["osascript", "-i"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                text=True,
+            )
+        try:
+            self._osa_proc.stdin.write(script + "\n")
+            self._osa_proc.stdin.flush()
+        except OSError:
+            # Interactive session died; fall back to a one-off osascript call
+            self._osa_proc = None
+            subprocess.run(["osascript", "-e", script], stdout=subprocess.DEVNULL)
+    
+    def flush_volume(self):
+        """Set the pending smoothed volume if it changed, at most every volume_update_interval"""
+        # A held gesture exits on the integer compare alone
+        if self._pending_vol is None or self._pending_vol == self._last_vol_sent:
+            return
+        # Leave the value pending while the previous amixer call is still running
+        if self._amixer_proc is not None and self._amixer_proc.poll() is None:
+            return
+        now = time.monotonic()
+        if now - self._last_vol_ts >= self.volume_update_interval:
+            self.set_volume(self._pending_vol)
+            self._last_vol_sent = self._pending_vol
+            self._last_vol_ts = now
+    
     def get_distance(self, point1, point2):
         """Calculate distance between two points"""
-        return math.sqrt((point2[0] - point1[0])**2 + (point2[1] - point1[1])**2)
+        return math.hypot(point2[0] - point1[0], point2[1] - point1[1])
     
-    def smooth_volume(self, current_vol, history_list):
+    def smooth_volume(self, current_vol, history):
         """Apply smoothing to volume changes"""
-        history_list.append(current_vol)
-        if len(history_list) > self.history_size:
-            history_list.pop(0)
-        return int(sum(history_list) / len(history_list))
+        return int(history.update(current_vol))
+    
+    def _build_overlay(self, shape):
+        """Render the static overlay elements once into a full-frame image and mask"""
+        overlay = np.zeros(shape, dtype=np.uint8)
+        mask = np.zeros(shape[:2], dtype=np.uint8)
+        # Volume bar background
+        _draw_solid(overlay, mask, lambda canvas, color: cv2.rectangle(canvas, (50, 150), (85, 400), color, 3), (255, 0, 0))
+        # Instructions
+        _draw_solid(overlay, mask, lambda canvas, color: cv2.putText(canvas, 'Pinch to Control Volume', (200, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, color, 2), (0, 255, 0))
+        _draw_solid(overlay, mask, lambda canvas, color: cv2.putText(canvas, 'Press Q to Quit', (200, 100), cv2.FONT_HERSHEY_SIMPLEX, 1, color, 2), (0, 255, 0))
+        return overlay, mask
+    
+    def _build_volume_label(self, shape, vol_per):
+        """Render the percentage and level labels for one volume into a cropped patch and mask"""
+        color = (0, 255, 0) if vol_per > 0 else (0, 0, 255)
+        labels = [
+            (f'{vol_per}%', (40, 450), cv2.FONT_HERSHEY_COMPLEX, (255, 0, 0), 3),
+            (f'Volume: {vol_per}%', (200, 400), cv2.FONT_HERSHEY_SIMPLEX, color, 2),
+        ]
+        
+        # Bounding box of both labels, clipped to the frame
+        x0, y0, x1, y1 = shape[1], shape[0], 0, 0
+        for text, (x, y), font, _, thickness in labels:
+            (w, h), baseline = cv2.getTextSize(text, font, 1, thickness)
+            x0, y0 = min(x0, x - thickness), min(y0, y - h - thickness)
+            x1, y1 = max(x1, x + w + thickness), max(y1, y + baseline + thickness)
+        x0, y0 = max(x0, 0), max(y0, 0)
+        x1, y1 = max(min(x1, shape[1]), x0), max(min(y1, shape[0]), y0)
+        
+        patch = np.zeros((y1 - y0, x1 - x0, 3), dtype=np.uint8)
+        mask = np.zeros(patch.shape[:2], dtype=np.uint8)
+        if not patch.size:
+            # Labels fall entirely outside a small frame; nothing to draw
+            return (slice(y0, y1), slice(x0, x1)), patch, mask
+        for text, (x, y), font, label_color, thickness in labels:
+            org = (x - x0, y - y0)
+            _draw_solid(patch, mask, lambda canvas, c: cv2.putText(canvas, text, org, font, 1, c, thickness), label_color)
+        return (slice(y0, y1), slice(x0, x1)), patch, mask
     
     def draw_volume_bar(self, img, vol_per):
         """Draw volume bar on the image"""
-        # Volume bar background
-        cv2.rectangle(img, (50, 150), (85, 400), (255, 0, 0), 3)
+        # Static elements (bar outline, instructions) are copied from the cached overlay
+        if self._overlay is None or self._overlay.shape != img.shape:
+            self._overlay, self._overlay_mask = self._build_overlay(img.shape)
+            self._vol_labels = {}
+        cv2.copyTo(self._overlay, self._overlay_mask, img)
         
         # Volume bar fill
         bar_height = int(vol_per * 2.5)
         cv2.rectangle(img, (50, int(400 - bar_height)), (85, 400), (255, 0, 0), cv2.FILLED)
         
-        # Volume percentage text
-        cv2.putText(img, f'{int(vol_per)}%', (40, 450), cv2.FONT_HERSHEY_COMPLEX, 1, (255, 0, 0), 3)
+        # Volume percentage text and level indicator. They only change with the
+        # integer volume, so each value is rendered once and then copied in
+        vol_per_int = int(vol_per)
+        label = self._vol_labels.get(vol_per_int)
+        if label is None:
+            label = self._vol_labels[vol_per_int] = self._build_volume_label(img.shape, vol_per_int)
+        region, patch, mask = label
+        if patch.size:
+            cv2.copyTo(patch, mask, img[region])
+    
+    def _stage_frame(self, img):
+        """Copy a downscaled RGB version of the frame into the back inference buffer"""
+        h, w = img.shape[:2]
+        small_size = (int(w * self.inference_scale), int(h * self.inference_scale))
+        with self._buf_lock:
+            # Reuse the resize/RGB buffers across frames
+            if self._small_buf is None or self._small_buf.shape[1::-1] != small_size:
+                self._small_buf = np.empty((small_size[1], small_size[0], 3), dtype=np.uint8)
+                self._buf = [np.empty_like(self._small_buf), np.empty_like(self._small_buf)]
+            buf = self._buf[self._write_idx]
+            buf.flags.writeable = True
+            if self.use_opencl:
+                small = cv2.resize(cv2.UMat(img), small_size, interpolation=cv2.INTER_AREA)
+                np.copyto(buf, cv2.cvtColor(small, cv2.COLOR_BGR2RGB).get())
+            else:
+                cv2.resize(img, small_size, dst=self._small_buf, interpolation=cv2.INTER_AREA)
+                cv2.cvtColor(self._small_buf, cv2.COLOR_BGR2RGB, dst=buf)
+            # Read-only input lets MediaPipe skip an internal copy
+            buf.flags.writeable = False
+            self._frame_ready.set()
+    
+    def _inference_loop(self):
+        """Run MediaPipe on the newest staged frame on a background thread"""
+        seq = 0
+        try:
+            while not self._stop_event.is_set():
+                if not self._frame_ready.wait(timeout=0.1):
+                    continue
+                # Swap buffers so the main thread can stage the next frame
+                # while this one is processed
+                with self._buf_lock:
+                    self._frame_ready.clear()
+                    self._read_idx, self._write_idx = self._write_idx, self._read_idx
+                    frame = self._buf[self._read_idx]
+                results = self.hands.process(frame)
+                seq += 1
+                self._last_result = (seq, results)
+        finally:
+            self._stop_event.set()
+    
+    def process_frame(self, img):
+        """Hand a mirrored frame to hand detection, update volume and annotate it"""
+        # Bind constants and attributes used in the loop below to locals
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        filled = cv2.FILLED
+        hand_connections = self._hand_connections
+        min_d = float(self.min_hand_distance)
+        max_d = float(self.max_hand_distance)
+        
+        h, w = img.shape[:2]
+        self._stage_frame(img)
         
-        # Instructions
-        cv2.putText(img, 'Pinch to Control Volume', (200, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-        cv2.putText(img, 'Press Q to Quit', (200, 100), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+        # Pick up the newest hand detection; frames in between reuse the
+        # last landmarks for drawing only
+        seq, results = self._last_result
+        fresh = seq != self._consumed_seq
+        if fresh:
+            self._consumed_seq = seq
+            self._last_landmarks = results.multi_hand_landmarks
         
-        # Volume level indicator
-        color = (0, 255, 0) if vol_per > 0 else (0, 0, 255)
-        cv2.putText(img, f'Volume: {int(vol_per)}%', (200, 400), cv2.FONT_HERSHEY_SIMPLEX, 1, color, 2)
+        hand_detected = False
+        frame_scale = np.array([w, h], dtype=np.float32)
+        
+        if self._last_landmarks:
+            for hand_landmarks in self._last_landmarks:
+                hand_detected = True
+                
+                # Get landmark positions, converted to pixels in one vectorized step
+                num_landmarks = len(hand_landmarks.landmark)
+                lm_xy = np.fromiter(
+                    (c for lm in hand_landmarks.landmark for c in (lm.x, lm.y)),
+                    dtype=np.float32,
+                    count=2 * num_landmarks,
+                ).reshape(num_landmarks, 2)
+                landmarks = (lm_xy * frame_scale).astype(np.int32)
+                
+                # Draw hand skeleton and landmarks with one polylines call each;
+                # landmarks are zero-length segments, which render as dots
+                cv2.polylines(img, landmarks[hand_connections], False, (224, 224, 224), 2)
+                cv2.polylines(img, np.repeat(landmarks[:, None], 2, axis=1), False, (0, 0, 255), 6)
+                
+                # Get thumb tip (4) and index finger tip (8) positions
+                if len(landmarks) >= 9:
+                    thumb_tip, index_tip = map(tuple, landmarks[[4, 8]].tolist())
+                    
+                    # Draw circles on fingertips
+                    cv2.circle(img, thumb_tip, 15, (255, 0, 255), filled)
+                    cv2.circle(img, index_tip, 15, (255, 0, 255), filled)
+                    
+                    # Draw line between fingertips
+                    cv2.line(img, thumb_tip, index_tip, (255, 0, 255), 3)
+                    
+                    # Calculate distance between fingertips, clamped to the valid range
+                    distance, t = _gesture_kernel(
+                        thumb_tip[0], thumb_tip[1], index_tip[0], index_tip[1], min_d, max_d
+                    )
+                    
+                    # Only fresh detections update the volume
+                    if fresh:
+                        # Map distance to volume (inverted for intuitive control)
+                        vol = self.max_vol - (self.max_vol - self.min_vol) * t
+                        vol_per = 100.0 * (1.0 - t)
+                        
+                        # Apply smoothing
+                        self.current_vol_smooth = self.smooth_volume(vol, self.volume_history)
+                        self.current_vol_per_smooth = self.smooth_volume(vol_per, self.vol_per_history)
+                        self._pending_vol = self.current_vol_smooth
+                    
+                    # Visual feedback for pinch detection
+                    if distance < 50:
+                        cv2.circle(img, ((thumb_tip[0] + index_tip[0]) // 2, (thumb_tip[1] + index_tip[1]) // 2), 15, (0, 255, 0), filled)
+                    
+                    # Display distance
+                    cv2.putText(img, f'Distance: {int(distance)}', (200, 150), font, 1, (0, 0, 255), 2)
+        
+        # Show "No Hand Detected" message when no hand is visible
+        if not hand_detected:
+            cv2.putText(img, 'No Hand Detected', (200, 200), font, 1, (0, 0, 255), 2)
+            cv2.putText(img, 'Show your hand to camera', (200, 230), font, 0.7, (0, 0, 255), 2)
+        
+        # Set system volume; checked on every frame so a change held back by the
+        # throttle is still applied after the hand leaves the frame
+        self.flush_volume()
+        
+        # Draw volume bar
+        self.draw_volume_bar(img, self.current_vol_per_smooth)
+        return img
+    
+    def _capture_loop(self, cap, read_q, grab_only=False):
+        """Read and mirror camera frames on a background thread"""
+        try:
+            while not self._stop_event.is_set():
+                if grab_only:
+                    # Keep draining the driver buffer, but only decode frames
+                    # the main loop has room for
+                    success = cap.grab()
+                    if success and read_q.full():
+                        continue
+                    if success:
+                        success, img = cap.retrieve()
+                else:
+                    success, img = cap.read()
+                if not success:
+                    print("Failed to read from camera")
+                    break
+                
+                # Flip image horizontally for mirror effect
+                _put_latest(read_q, cv2.flip(img, 1, dst=img))
+        finally:
+            self._stop_event.set()
     
     def run(self):
         """Main execution loop"""
@@ -107,6 +455,13 @@ class GestureVolumeController:
             print("Make sure your camera is connected and not being used by another application")
             return
         
+        # Only keep the newest frame in the driver buffer to avoid lagging behind
+        grab_only = not cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        if grab_only:
+            print("Warning: could not shrink camera buffer, draining it with grab() instead")
+        
+        # MJPEG is far cheaper to decode than YUYV at this resolution
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
         cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
         cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
         
@@ -118,84 +473,39 @@ class GestureVolumeController:
         print("- Press 'q' to quit")
         print("- Press 'r' to reset volume history")
         
-        while True:
-            success, img = cap.read()
-            if not success:
-                print("Failed to read from camera")
-                break
-            
-            # Flip image horizontally for mirror effect
-            img = cv2.flip(img, 1)
-            img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-            
-            # Process hand detection
-            results = self.hands.process(img_rgb)
-            
-            hand_detected = False
-            
-            if results.multi_hand_landmarks:
-                for hand_landmarks in results.multi_hand_landmarks:
-                    hand_detected = True
-                    
-                    # Draw hand landmarks
-                    self.mp_drawing.draw_landmarks(img, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
-                    
-                    # Get landmark positions
-                    landmarks = []
-                    for lm in hand_landmarks.landmark:
-                        h, w, c = img.shape
-                        cx, cy = int(lm.x * w), int(lm.y * h)
-                        landmarks.append([cx, cy])
-                    
-                    # Get thumb tip (4) and index finger tip (8) positions
-                    if len(landmarks) >= 9:
-                        thumb_tip = landmarks[4]
-                        index_tip = landmarks[8]
-                        
-                        # Draw circles on fingertips
-                        cv2.circle(img, tuple(thumb_tip), 15, (255, 0, 255), cv2.FILLED)
-                        cv2.circle(img, tuple(index_tip), 15, (255, 0, 255), cv2.FILLED)
-                        
-                        # Draw line between fingertips
-                        cv2.line(img, tuple(thumb_tip), tuple(index_tip), (255, 0, 255), 3)
-                        
-                        # Calculate distance between fingertips
-                        distance = self.get_distance(thumb_tip, index_tip)
-                        
-                        # Clamp distance to valid range
-                        distance = max(self.min_hand_distance, min(distance, self.max_hand_distance))
-                        
-                        # Map distance to volume (inverted for intuitive control)
-                        vol = np.interp(distance, [self.min_hand_distance, self.max_hand_distance], [self.max_vol, self.min_vol])
-                        vol_per = np.interp(distance, [self.min_hand_distance, self.max_hand_distance], [100, 0])
-                        
-                        # Apply smoothing
-                        self.current_vol_smooth = self.smooth_volume(vol, self.volume_history)
-                        self.current_vol_per_smooth = self.smooth_volume(vol_per, self.vol_per_history)
-                        
-                        # Set system volume
-                        self.set_volume(self.current_vol_smooth)
-                        
-                        # Visual feedback for pinch detection
-                        if distance < 50:
-                            cv2.circle(img, ((thumb_tip[0] + index_tip[0]) // 2, (thumb_tip[1] + index_tip[1]) // 2), 15, (0, 255, 0), cv2.FILLED)
-                        
-                        # Display distance
-                        cv2.putText(img, f'Distance: {int(distance)}', (200, 150), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
-            
-            # Show "No Hand Detected" message when no hand is visible
-            if not hand_detected:
-                cv2.putText(img, 'No Hand Detected', (200, 200), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
-                cv2.putText(img, 'Show your hand to camera', (200, 230), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
+        # Camera capture and MediaPipe inference run on their own threads so they
+        # overlap with drawing; HighGUI stays on the main thread as imshow/waitKey
+        # must not leave it on every OS.
+        read_q = queue.Queue(maxsize=2)
+        self._stop_event = threading.Event()
+        workers = [
+            threading.Thread(target=self._capture_loop, args=(cap, read_q, grab_only), daemon=True),
+            threading.Thread(target=self._inference_loop, daemon=True),
+        ]
+        for worker in workers:
+            worker.start()
+        
+        # Bind per-frame lookups to locals once. pollKey returns immediately,
+        # while waitKey(1) can sleep a full scheduler tick on Windows.
+        get_frame = read_q.get
+        process_frame = self.process_frame
+        imshow = cv2.imshow
+        poll_key = cv2.pollKey if hasattr(cv2, 'pollKey') else lambda: cv2.waitKey(1)
+        stopped = self._stop_event.is_set
+        
+        while not stopped():
+            try:
+                img = get_frame(timeout=0.1)
+            except queue.Empty:
+                continue
             
-            # Draw volume bar
-            self.draw_volume_bar(img, self.current_vol_per_smooth)
+            img = process_frame(img)
             
             # Display the image
-            cv2.imshow('Gesture Volume Controller', img)
+            imshow('Gesture Volume Controller', img)
             
             # Check for quit or reset
-            key = cv2.waitKey(1) & 0xFF
+            key = poll_key() & 0xFF
             if key == ord('q'):
                 break
             elif key == ord('r'):
@@ -205,7 +515,17 @@ class GestureVolumeController:
                 print("Volume history reset!")
         
         # Cleanup
+        self._stop_event.set()
+        for worker in workers:
+            worker.join()
         cap.release()
+        if self._osa_proc is not None:
+            self._osa_proc.stdin.close()
+            self._osa_proc.wait()
+            self._osa_proc = None
+        if self._amixer_proc is not None:
+            self._amixer_proc.wait()
+            self._amixer_proc = None
         cv2.destroyAllWindows()
         print("Gesture Volume Controller stopped!")
 
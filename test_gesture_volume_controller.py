@@ -0,0 +1,106 @@
+import pytest
+
+pytest.importorskip("cv2")
+pytest.importorskip("mediapipe")
+
+import gesture_volume_controller
+from gesture_volume_controller import GestureVolumeController, RunningMean
+
+
+@pytest.fixture
+def controller(monkeypatch):
+    """Controller set up by the real __init__, without loading the MediaPipe model"""
+    monkeypatch.setattr(gesture_volume_controller.mp.solutions.hands, "Hands", lambda **kwargs: None)
+    return GestureVolumeController()
+
+
+def test_running_mean_holds_endpoint():
+    history = RunningMean(5)
+    for value in [73.3, 12.7, 45.1, 88.9, 61.3, 99.4, 17.7]:
+        history.update(value)
+    for _ in range(5):
+        mean = history.update(100.0)
+    assert int(mean) == 100
+
+
+def test_running_mean_window_and_clear():
+    history = RunningMean(3)
+    assert [history.update(v) for v in (3, 6, 9, 12)] == [3, 4.5, 6, 9]
+    history.clear()
+    assert len(history) == 0
+    assert history.update(7) == 7
+
+
+def test_flush_volume_sends_throttled_value_later(controller, monkeypatch):
+    controller.volume_update_interval = 0.05
+    sent = []
+    controller.set_volume = sent.append
+    clock = iter([10.0, 10.01, 10.06])
+
+    # Nothing is sent before a hand has been detected
+    controller.flush_volume()
+    assert sent == []
+    monkeypatch.setattr("gesture_volume_controller.time.monotonic", lambda: next(clock))
+
+    controller._pending_vol = 40
+    controller.flush_volume()
+    controller._pending_vol = 55
+    controller.flush_volume()
+    assert sent == [40]
+
+    # No new detections arrive, but the pending value is applied once the interval passes
+    controller.flush_volume()
+    assert sent == [40, 55]
+
+
+def test_flush_volume_waits_for_running_amixer(controller):
+    class FakeProc:
+        returncode = None
+
+        def poll(self):
+            return self.returncode
+
+    controller.volume_update_interval = 0.0
+    controller._pending_vol = 70
+    controller._amixer_proc = FakeProc()
+    sent = []
+    controller.set_volume = sent.append
+
+    controller.flush_volume()
+    assert sent == []
+
+    controller._amixer_proc.returncode = 0
+    controller.flush_volume()
+    assert sent == [70]
+
+
+def _draw_volume_bar_with_put_text(img, vol_per):
+    cv2 = gesture_volume_controller.cv2
+    cv2.rectangle(img, (50, 150), (85, 400), (255, 0, 0), 3)
+    cv2.rectangle(img, (50, int(400 - int(vol_per * 2.5))), (85, 400), (255, 0, 0), cv2.FILLED)
+    cv2.putText(img, f'{vol_per}%', (40, 450), cv2.FONT_HERSHEY_COMPLEX, 1, (255, 0, 0), 3)
+    cv2.putText(img, 'Pinch to Control Volume', (200, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+    cv2.putText(img, 'Press Q to Quit', (200, 100), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+    color = (0, 255, 0) if vol_per > 0 else (0, 0, 255)
+    cv2.putText(img, f'Volume: {vol_per}%', (200, 400), cv2.FONT_HERSHEY_SIMPLEX, 1, color, 2)
+
+
+@pytest.mark.parametrize("vol_per", [0, 37, 100])
+def test_draw_volume_bar_matches_put_text(controller, vol_per):
+    np = gesture_volume_controller.np
+    if not gesture_volume_controller.cv2.__version__.startswith("4."):
+        pytest.skip("OpenCV 5 anti-aliases putText, the cached overlay is hard-edged")
+    base = np.random.default_rng(vol_per).integers(0, 256, (480, 640, 3), dtype=np.uint8)
+    expected = base.copy()
+    _draw_volume_bar_with_put_text(expected, vol_per)
+    for _ in range(2):  # first call renders the label, second uses the cache
+        img = base.copy()
+        controller.draw_volume_bar(img, vol_per)
+        assert np.array_equal(img, expected)
+
+
+@pytest.mark.parametrize("shape", [(360, 640, 3), (240, 320, 3), (480, 640, 3)])
+def test_draw_volume_bar_handles_frame_sizes(controller, shape):
+    np = gesture_volume_controller.np
+    for vol_per in (0, 50, 100):
+        controller.draw_volume_bar(np.zeros(shape, dtype=np.uint8), vol_per)